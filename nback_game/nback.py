@@ -14,6 +14,8 @@ Options:
     -g, --grid-size N     Set the grid size (3-9, default: 8)
     -t, --trials N        Set number of trials (default: 20)
     -d, --display-time N  Set display time in seconds (default: 2.0)
+    --fast                Skip the pause after each trial's feedback
+                          (pacing only; the menu is still shown)
     -h, --help           Show this help message
 
 Controls:
@@ -30,13 +32,19 @@ import random
 import time
 import sys
 import argparse
+import array
+import atexit
 import json
+import functools
+import heapq
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Union
+from typing import Iterator, List, Tuple, Optional, Dict, Union
 import termios
 import tty
-import select
+import selectors
+import signal
 
 # Enhanced ANSI color codes with bright variants
 ANSI_COLORS = {
@@ -63,8 +71,32 @@ THEME = {
     "RESET": "\033[0m",          # Reset
 }
 
+# Theme codes bound once for the hot render paths
+_H, _S, _E, _W, _I, _A, _D, _B, _R = (
+    THEME[k] for k in ("HEADER", "SUCCESS", "ERROR", "WARNING", "INFO", "ACCENT", "DIM", "BOLD", "RESET")
+)
+
 ANSI_RESET = "\033[0m"
 
+# Closing prompts shared by several screens
+_PROMPT_CONTINUE = f"{_D}Press any key to continue...{_R}"
+_PROMPT_BEGIN = f"{_S}Press any key to begin training...{_R}"
+_PROMPT_MENU = f"{_D}Press any key to return to menu...{_R}"
+
+# Color names in a fixed order; stimuli refer to colors by index
+COLOR_NAMES = tuple(ANSI_COLORS)
+
+# Cursor home, erase display, erase scrollback
+ANSI_CLEAR = "\033[H\033[2J\033[3J"
+ANSI_HIDE_CURSOR = "\033[?25l"
+ANSI_SHOW_CURSOR = "\033[?25h"
+
+IS_WINDOWS = os.name == 'nt'
+
+# Grid cell dimensions in characters
+CELL_W = 7
+CELL_H = 3
+
 # Decorative elements
 SYMBOLS = {
     "DOT": "●",
@@ -77,6 +109,311 @@ SYMBOLS = {
 }
 
 
+def _query_terminal_size() -> os.terminal_size:
+    """
+    Query the size of the terminal attached to stdout.
+
+    Returns:
+        Terminal size, or 80x24 when stdout is not a terminal
+    """
+    try:
+        return os.get_terminal_size()
+    except OSError:
+        return os.terminal_size((80, 24))
+
+
+def _centered(text: str, width: int) -> str:
+    """
+    Center text for the given width as a newline-terminated line.
+
+    Args:
+        text: Text to center
+        width: Terminal width
+
+    Returns:
+        Centered line ending in a newline
+    """
+    return text.center(width) + "\n"
+
+
+@functools.lru_cache(maxsize=32)
+def _centered_line(text: str, width: int) -> str:
+    """
+    Center a line that is reused verbatim across screens, such as a prompt.
+
+    Args:
+        text: Text to center
+        width: Terminal width
+
+    Returns:
+        Centered line ending in a newline
+    """
+    return _centered(text, width)
+
+
+@functools.lru_cache(maxsize=8)
+def _header_rule(width: int) -> str:
+    """
+    Build the full-width header rule for the given width.
+
+    Args:
+        width: Terminal width
+
+    Returns:
+        Colored rule line ending in a newline
+    """
+    return f"{_H}{'═' * width}{_R}\n"
+
+
+def _header_lines(title: str, width: int) -> List[str]:
+    """
+    Build the lines of a styled header.
+
+    Args:
+        title: Header title
+        width: Terminal width
+
+    Returns:
+        List of newline-terminated header lines
+    """
+    rule = _header_rule(width)
+    return [
+        "\n",
+        rule,
+        _centered(f"{_H}{SYMBOLS['BRAIN']} {title} {SYMBOLS['BRAIN']}{_R}", width),
+        rule,
+        "\n",
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _render_menu(width: int) -> str:
+    """
+    Render the main menu screen for the given width.
+
+    Args:
+        width: Terminal width
+
+    Returns:
+        The full menu as a single string
+    """
+    parts = ["\n" * 3]
+
+    # Title
+    parts.append(_centered(f"{_H}╔═══════════════════════════════════════════════╗{_R}", width))
+    parts.append(_centered(f"{_H}║                                               ║{_R}", width))
+    parts.append(_centered(f"{_H}║        {SYMBOLS['BRAIN']} DUAL N-BACK TRAINER {SYMBOLS['BRAIN']}        ║{_R}", width))
+    parts.append(_centered(f"{_H}║      Cognitive Enhancement Training          ║{_R}", width))
+    parts.append(_centered(f"{_H}║                                               ║{_R}", width))
+    parts.append(_centered(f"{_H}╚═══════════════════════════════════════════════╝{_R}", width))
+
+    parts.append("\n" * 3)
+
+    # Menu options
+    parts.append(_centered(f"{_S}1{_R} {SYMBOLS['ARROW']} Start New Game", width))
+    parts.append("\n")
+    parts.append(_centered(f"{_I}2{_R} {SYMBOLS['ARROW']} View High Scores", width))
+    parts.append("\n")
+    parts.append(_centered(f"{_W}3{_R} {SYMBOLS['ARROW']} Help & Instructions", width))
+    parts.append("\n")
+    parts.append(_centered(f"{_E}4{_R} {SYMBOLS['ARROW']} Exit", width))
+
+    parts.append("\n" * 3)
+    parts.append(_centered(f"{_D}Select an option (1-4):{_R}", width))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_help(width: int) -> str:
+    """
+    Render the help screen for the given width.
+
+    Args:
+        width: Terminal width
+
+    Returns:
+        The full help screen as a single string
+    """
+    parts = _header_lines("HELP GUIDE", width)
+
+    parts.append(_centered(f"{_B}What is Dual N-Back?{_R}", width))
+    parts.append("\n")
+    parts.append(_centered("A cognitive training task that improves working memory", width))
+    parts.append(_centered("by tracking both position and color sequences.", width))
+    parts.append("\n")
+    parts.append("\n")
+
+    parts.append(_centered(f"{_B}How to Play:{_R}", width))
+    parts.append("\n")
+    parts.append(_centered(f"{_S}{SYMBOLS['ARROW']}{_R} Watch the colored dot appear on the grid", width))
+    parts.append(_centered(f"{_S}{SYMBOLS['ARROW']}{_R} Remember positions and colors from N steps back", width))
+    parts.append(_centered(f"{_S}{SYMBOLS['ARROW']}{_R} Press keys when you detect a match", width))
+    parts.append("\n")
+    parts.append("\n")
+
+    parts.append(_centered(f"{_B}Controls:{_R}", width))
+    parts.append("\n")
+    parts.append(_centered(f"{_I}L{_R}          Match in location/position", width))
+    parts.append(_centered(f"{_I}A{_R}          Match in color", width))
+    parts.append(_centered(f"{_I}SPACE{_R}      Both location AND color match", width))
+    parts.append(_centered(f"{_I}H{_R}          Show this help", width))
+    parts.append(_centered(f"{_I}Q{_R}          Quit to menu", width))
+    parts.append(_centered(f"{_I}S{_R}          View high scores", width))
+    parts.append("\n")
+
+    parts.append(_centered_line(_PROMPT_CONTINUE, width))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=4)
+def _progress_bars(width: int) -> Tuple[str, ...]:
+    """
+    Build every fill level of a progress bar of the given width.
+
+    Args:
+        width: Width of the progress bar
+
+    Returns:
+        Tuple of bar strings indexed by the number of filled cells
+    """
+    return tuple(f"[{'█' * filled}{'░' * (width - filled)}]" for filled in range(width + 1))
+
+
+# Colored dot per color index; only the glyph carries an SGR pair, the
+# padding around it is plain spaces
+_DOT_GLYPH = tuple(f"{ANSI_COLORS[name]}{SYMBOLS['DOT']}{ANSI_RESET}" for name in COLOR_NAMES)
+
+# Column of the dot within its cell
+_DOT_OFFSET = (CELL_W - 1) // 2
+
+
+def _build_dot_cells(cell_width: int) -> Tuple[str, ...]:
+    """
+    Build the padded, colored dot cell for every color.
+
+    Args:
+        cell_width: Width of a grid cell in characters
+
+    Returns:
+        Rendered cell per color, indexed like COLOR_NAMES
+    """
+    left_pad = (cell_width - 1) // 2
+    right_pad = cell_width - 1 - left_pad
+    return tuple(" " * left_pad + glyph + " " * right_pad for glyph in _DOT_GLYPH)
+
+
+# Rendered dot cell per color index
+_DOT_CELL = _build_dot_cells(CELL_W)
+
+# Placeholder marking the dot's cell in a pre-rendered grid row
+_DOT_SLOT = "\x00" * CELL_W
+
+
+# Per-trial status line: trial, trials, progress bar, score, matches, accuracy
+_STATUS_TMPL = f"{_I}Trial: %d/%d %s Score: {_S}%d{_R}{_I}/%d (%.1f%%){_R}"
+
+
+# (points, correct) for each (response, visual match, color match)
+SCORE_TABLE: Dict[Tuple[str, bool, bool], Tuple[int, bool]] = {
+    ('l', True, False): (1, True),
+    ('l', True, True): (0, False),
+    ('l', False, True): (0, False),
+    ('l', False, False): (0, False),
+    ('a', False, True): (1, True),
+    ('a', True, True): (0, False),
+    ('a', True, False): (0, False),
+    ('a', False, False): (0, False),
+    ('both', True, True): (2, True),
+    ('both', True, False): (0, False),
+    ('both', False, True): (0, False),
+    ('both', False, False): (0, False),
+}
+
+
+# Selectable settings offered by the configuration screens
+LEVELS = (
+    ("1", "N=1", "Beginner"),
+    ("2", "N=2", "Easy"),
+    ("3", "N=3", "Normal"),
+    ("4", "N=4", "Challenging"),
+    ("5", "N=5", "Hard"),
+    ("6", "N=6", "Very Hard"),
+    ("7", "N=7", "Expert"),
+    ("8", "N=8", "Master"),
+)
+TRIAL_OPTIONS = (20, 30, 40, 50, 60, 80)
+TIME_OPTIONS = (1.0, 1.5, 2.0, 2.5, 3.0)
+
+# Values accepted on the command line
+_N_CHOICES = tuple(range(1, 9))
+_G_CHOICES = tuple(range(3, 10))
+_T_CHOICES = TRIAL_OPTIONS
+
+
+@functools.lru_cache(maxsize=16)
+def _render_settings_step(step: int, width: int) -> str:
+    """
+    Render one step of the game configuration screens for the given width.
+
+    Args:
+        step: Configuration step (1-4)
+        width: Terminal width
+
+    Returns:
+        The full configuration screen as a single string
+    """
+    recommended = f"{_S} (Recommended){_R}"
+    if step == 1:
+        title = "Select N-Back Level"
+        options = [
+            f"{_I}{num}{_R} {SYMBOLS['ARROW']} {level:<8} {_D}{difficulty}{_R}"
+            f"{recommended if int(num) == 2 else ''}"
+            for num, level, difficulty in LEVELS
+        ]
+    elif step == 2:
+        title = "Select Grid Size"
+        options = [
+            f"{_I}{size}{_R} {SYMBOLS['ARROW']} {size}×{size} Grid{recommended if size == 8 else ''}"
+            for size in range(3, 10)
+        ]
+    elif step == 3:
+        title = "Select Trial Count"
+        options = [
+            f"{_I}{i}{_R} {SYMBOLS['ARROW']} {trials} Trials{recommended if trials == 20 else ''}"
+            for i, trials in enumerate(TRIAL_OPTIONS, 1)
+        ]
+    else:
+        title = "Select Response Time"
+        options = [
+            f"{_I}{i}{_R} {SYMBOLS['ARROW']} {t:.1f}s per trial{recommended if t == 2.0 else ''}"
+            for i, t in enumerate(TIME_OPTIONS, 1)
+        ]
+
+    parts = _header_lines("GAME CONFIGURATION", width)
+    parts.append(_centered(f"{_A}Step {step} of 4: {title}{_R}", width))
+    parts.append("\n")
+    for option in options:
+        parts.append(_centered(option, width))
+    return "".join(parts)
+
+
+# Key legend shown under the grid; static apart from centering
+_CONTROLS_BOX = (
+    f"{_A}┌───────────────────────────────────────────────┐{_R}",
+    f"{_A}│{_R}  "
+    f"{_I}L{_R} Location   "
+    f"{_I}A{_R} Color   "
+    f"{_I}SPACE{_R} Both  "
+    f"{_D}[H]elp [Q]uit [S]cores{_R}"
+    f"  {_A}│{_R}",
+    f"{_A}└───────────────────────────────────────────────┘{_R}",
+)
+
+# Narrowest terminal in which no status or controls line wraps, so the
+# grid frame's line count matches its screen rows
+_REFRESH_MIN_WIDTH = 80
+
+
 class NBackGame:
     """
     Dual N-Back training game implementation.
@@ -85,12 +422,16 @@ class NBackGame:
     a dual N-Back cognitive training task that improves working memory.
     """
 
+    # Parsed scores file shared across instances, keyed by its path and mtime
+    _scores_cache: Optional[Tuple[str, int, Dict]] = None
+
     def __init__(
         self,
         n: int = 2,
         grid_size: int = 8,
         trials: int = 20,
-        display_time: float = 2.0
+        display_time: float = 2.0,
+        fast: bool = False
     ) -> None:
         """
         Initialize the N-Back game.
@@ -100,22 +441,114 @@ class NBackGame:
             grid_size: Size of the grid (3-9)
             trials: Number of trials to play
             display_time: Time to display each position in seconds
+            fast: Skip the pause after each trial's feedback
         """
         self.n = n
         self.grid_size = grid_size
         self.trials = trials
         self.display_time = display_time
+        self.fast = fast
 
         # Game state
-        self.sequence: List[Tuple[int, int]] = []  # Visual positions
-        self.color_sequence: List[str] = []        # Color names
+        # Stimuli for the whole session, generated up front
+        self.sequence = array.array('B')        # Cell indices
+        self.color_sequence = array.array('B')  # Color indices
         self.score = 0
         self.total_matches = 0
         self.current_trial = 0
         self.is_running = True
 
-        # High scores
+        # Terminal settings saved while stdin is held in cbreak mode
+        self._saved_tty: Optional[List] = None
+
+        # Readiness selector for stdin, created on first use
+        self._sel: Optional[selectors.BaseSelector] = None
+
+        # Keys read from stdin but not yet consumed
+        self._pending_keys = ""
+
+        # Terminal size, refreshed on SIGWINCH while the terminal is held
+        # instead of queried per screen
+        self._term_size = _query_terminal_size()
+
+        # Last frame rendered by display_grid, for cheap repaints
+        self._last_frame = ""
+
+        # Layout, dot position and in-place refresh fit of the last grid
+        # frame, and whether it is still what the terminal shows
+        self._grid_state: Optional[Tuple[Tuple, int, bool]] = None
+        self._grid_on_screen = False
+
+        # Pre-rendered grid borders and header
+        self._build_grid_chrome()
+
+        # High scores, written back once when the game is closed
+        self._scores_path = Path.home() / '.nback_scores.json'
         self.high_scores: Dict = self.load_high_scores()
+        self._scores_dirty = False
+
+        # Top scores ranking, keyed by a counter bumped on every new record
+        self._scores_version = 0
+        self._top_scores: Optional[Tuple[int, List[Tuple[str, Dict]]]] = None
+
+    def _on_resize(self, signum: int, frame: object) -> None:
+        """Refresh the cached terminal size after the window is resized."""
+        self._term_size = _query_terminal_size()
+        # The terminal reflows its contents, so in-place updates are unsafe
+        self._grid_on_screen = False
+        self._padded_chrome = None
+
+    def _on_terminate(self, signum: int, frame: object) -> None:
+        """Turn a hangup or termination request into a normal exit."""
+        # SystemExit unwinds through the finally blocks that restore the
+        # terminal and flush pending high scores
+        raise SystemExit(128 + signum)
+
+    def _build_grid_chrome(self) -> None:
+        """Pre-render the grid borders, blank cells and header for the current settings."""
+        self._top_border = "╔" + ("═" * CELL_W + "╦") * (self.grid_size - 1) + "═" * CELL_W + "╗"
+        self._mid_border = "╠" + ("═" * CELL_W + "╬") * (self.grid_size - 1) + "═" * CELL_W + "╣"
+        self._bottom_border = "╚" + ("═" * CELL_W + "╩") * (self.grid_size - 1) + "═" * CELL_W + "╝"
+        self._grid_width = len(self._top_border)
+        self._empty_cell = " " * CELL_W
+        self._empty_row = "║" + "║".join([self._empty_cell] * self.grid_size) + "║\n"
+        # Row with the dot's cell left as a placeholder, one per column
+        self._dot_rows = tuple(
+            "║" + "║".join(
+                _DOT_SLOT if col == dot_col else self._empty_cell
+                for col in range(self.grid_size)
+            ) + "║\n"
+            for dot_col in range(self.grid_size)
+        )
+        self._padded_chrome: Optional[Tuple[str, Tuple[str, str, str, str, Tuple[str, ...]]]] = None
+        self._grid_header = (
+            f"{_H}╔═══════════════════════════════════════╗{_R}",
+            f"{_H}║  DUAL N-BACK TRAINER  {SYMBOLS['BRAIN']}  Level: {self.n}  ║{_R}",
+            f"{_H}╚═══════════════════════════════════════╝{_R}",
+        )
+
+    def _grid_lines(self, pad: str) -> Tuple[str, str, str, str, Tuple[str, ...]]:
+        """
+        Get the border, blank and dot row lines with the given left padding applied.
+
+        The result is reused until the padding or grid settings change.
+
+        Args:
+            pad: Left padding that centers the grid
+
+        Returns:
+            Tuple of (top, middle, blank row, bottom) newline-terminated lines,
+            followed by the dot row template for each column
+        """
+        if self._padded_chrome is None or self._padded_chrome[0] != pad:
+            self._padded_chrome = (pad, (
+                pad + self._top_border + "\n",
+                pad + self._mid_border + "\n",
+                pad + self._empty_row,
+                pad + self._bottom_border + "\n",
+                tuple(pad + row for row in self._dot_rows),
+            ))
+        return self._padded_chrome[1]
 
     def load_high_scores(self) -> Dict:
         """
@@ -124,18 +557,34 @@ class NBackGame:
         Returns:
             Dictionary containing high score data
         """
-        scores_file = Path.home() / '.nback_scores.json'
-        if scores_file.exists():
-            try:
-                with open(scores_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"{THEME['WARNING']}Warning: Could not load scores: {e}{THEME['RESET']}")
-                return {}
-        return {}
+        scores_file = self._scores_path
+        try:
+            mtime = scores_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        # Each game gets its own copy, so records it has not yet written
+        # never leak into the shared cache; entries are replaced, not mutated
+        cache = NBackGame._scores_cache
+        if cache is not None and cache[0] == str(scores_file) and cache[1] == mtime:
+            return dict(cache[2])
+
+        try:
+            with open(scores_file, 'r', encoding='utf-8') as f:
+                scores = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"{THEME['WARNING']}Warning: Could not load scores: {e}{THEME['RESET']}")
+            return {}
+
+        NBackGame._scores_cache = (str(scores_file), mtime, scores)
+        return dict(scores)
 
     def save_high_score(self) -> None:
-        """Save high score if it's a new record."""
+        """
+        Record the session's score if it's a new record.
+
+        The scores file is only rewritten by flush_scores.
+        """
         if self.total_matches == 0:
             return
 
@@ -149,32 +598,185 @@ class NBackGame:
                 'total': self.total_matches,
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
+            self._scores_dirty = True
+            self._scores_version += 1
 
-            scores_file = Path.home() / '.nback_scores.json'
-            try:
-                with open(scores_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.high_scores, f, indent=2)
-            except IOError as e:
-                print(f"{THEME['ERROR']}Error saving scores: {e}{THEME['RESET']}")
+    def flush_scores(self) -> None:
+        """Write the high scores to file if any were recorded since the last write."""
+        if not self._scores_dirty:
+            return
 
-    def get_char(self) -> Optional[str]:
+        scores_file = self._scores_path
+        tmp_file = scores_file.with_suffix('.json.tmp')
+        data = json.dumps(self.high_scores, separators=(',', ':')).encode('utf-8')
+        NBackGame._scores_cache = None
+        try:
+            # Write the whole file at once, then swap it into place so a
+            # crash never leaves a truncated scores file behind
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, scores_file)
+            # Only a completed write clears the flag, so a failed one is retried
+            self._scores_dirty = False
+        except IOError as e:
+            print(f"{THEME['ERROR']}Error saving scores: {e}{THEME['RESET']}")
+
+    def _enter_raw(self) -> None:
         """
-        Get a single character from stdin without requiring Enter.
+        Hold stdin in cbreak mode until _exit_raw is called.
+
+        Output post-processing and signals stay enabled so frames render
+        normally and Ctrl-C still interrupts the game. Does nothing if the
+        terminal is already held, so the first saved settings are kept.
+        """
+        if self._saved_tty is not None:
+            return
+        fd = sys.stdin.fileno()
+        self._saved_tty = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+
+    def _exit_raw(self) -> None:
+        """Restore the terminal settings saved by _enter_raw."""
+        if self._saved_tty is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_tty)
+            self._saved_tty = None
+
+    @contextmanager
+    def _raw_terminal(self) -> Iterator[None]:
+        """
+        Hold stdin in cbreak mode for the duration of the block.
+
+        Nested uses share the outermost hold, and the settings are also
+        restored at interpreter exit in case the block is never left.
+        While the block runs, resizes are tracked through SIGWINCH and
+        SIGHUP/SIGTERM exit through the normal cleanup path; the previous
+        handlers are put back afterwards.
+        """
+        if self._saved_tty is not None:
+            yield
+            return
+        self._enter_raw()
+        atexit.register(self._exit_raw)
+        handlers = {}
+        for name, handler in (
+            ('SIGWINCH', self._on_resize),
+            ('SIGHUP', self._on_terminate),
+            ('SIGTERM', self._on_terminate),
+        ):
+            if hasattr(signal, name):
+                signum = getattr(signal, name)
+                handlers[signum] = signal.signal(signum, handler)
+        if hasattr(signal, 'SIGWINCH'):
+            # Pick up any resize made while no handler was installed
+            self._on_resize(signal.SIGWINCH, None)
+        try:
+            yield
+        finally:
+            for signum, previous in handlers.items():
+                signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+            self._exit_raw()
+            atexit.unregister(self._exit_raw)
+
+    def _stdin_selector(self) -> selectors.BaseSelector:
+        """
+        Get the selector watching stdin, registering it on first use.
 
         Returns:
-            Character pressed or None if no input within timeout
+            Selector with stdin registered for read events
         """
+        if self._sel is None:
+            self._sel = selectors.DefaultSelector()
+            self._sel.register(sys.stdin, selectors.EVENT_READ)
+        return self._sel
+
+    def close(self) -> None:
+        """Write any pending high scores and release the stdin selector."""
+        self.flush_scores()
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
+
+    @contextmanager
+    def _key_mode(self) -> Iterator[None]:
+        """Switch stdin to raw mode for a single read unless already held."""
+        if self._saved_tty is not None:
+            yield
+            return
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(sys.stdin.fileno())
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                char = sys.stdin.read(1)
-                return char.lower()
-            return None
+            tty.setraw(fd)
+            yield
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
+    def _next_key(self, timeout: Optional[float]) -> Optional[str]:
+        """
+        Get the next key press, reading everything pending at once.
+
+        Keys beyond the first are kept for subsequent calls, so a burst of
+        input costs a single read.
+
+        Args:
+            timeout: Seconds to wait for input (None waits indefinitely)
+
+        Returns:
+            Lowercase key, None if no input within timeout, or an empty
+            string at end of input
+        """
+        if not self._pending_keys:
+            if not self._stdin_selector().select(timeout):
+                return None
+            data = os.read(sys.stdin.fileno(), 64)
+            if not data:
+                return ""
+            self._pending_keys = data.decode('utf-8', 'ignore').lower()
+            if not self._pending_keys:
+                return None
+        key = self._pending_keys[0]
+        self._pending_keys = self._pending_keys[1:]
+        return key
+
+    def _wait_or_quit(self, duration: float) -> bool:
+        """
+        Pause for the given duration, ending early if the player quits.
+
+        Other keys pressed during the pause are discarded rather than
+        carried over as an answer to the next trial.
+
+        Args:
+            duration: Seconds to pause
+
+        Returns:
+            True if the player pressed Q, False otherwise
+        """
+        deadline_ns = time.monotonic_ns() + int(duration * 1e9)
+        while True:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                return False
+            remaining = remaining_ns / 1e9
+            key = self._next_key(remaining)
+            if key is None:
+                return False
+            if key == "":
+                # End of input: nothing more can arrive, just finish the pause
+                time.sleep(remaining)
+                return False
+            if key == 'q':
+                self.is_running = False
+                return True
+
+    def get_char(self) -> Optional[str]:
+        """
+        Get a single character from stdin without requiring Enter.
+
+        Returns:
+            Character pressed or None if no input within timeout
+        """
+        with self._key_mode():
+            return self._next_key(0.1)
+
     def wait_for_key(self) -> str:
         """
         Wait for a single key press and return it.
@@ -182,39 +784,74 @@ class NBackGame:
         Returns:
             The pressed key as a lowercase string
         """
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            char = sys.stdin.read(1)
-            return char.lower()
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        with self._key_mode():
+            key = None
+            while key is None:
+                key = self._next_key(None)
+            return key
 
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        self._grid_on_screen = False
+        if IS_WINDOWS:
+            os.system('cls')
+        else:
+            sys.stdout.write(ANSI_CLEAR)
+            sys.stdout.flush()
 
-    def generate_position(self) -> Tuple[int, int]:
+    def generate_position(self) -> int:
         """
         Generate a random position within the grid.
 
         Returns:
-            Tuple of (row, column) coordinates
+            Cell index, row * grid_size + column
         """
-        return (
-            random.randint(0, self.grid_size - 1),
-            random.randint(0, self.grid_size - 1)
-        )
+        return random.randrange(self.grid_size * self.grid_size)
+
+    def generate_color(self) -> int:
+        """
+        Randomly pick a color for the color stream.
+
+        Returns:
+            Index into COLOR_NAMES
+        """
+        return random.randrange(len(COLOR_NAMES))
+
+    def generate_stimuli(self, count: int) -> Tuple[array.array, array.array]:
+        """
+        Generate the positions and colors for a whole session in one batch.
+
+        Args:
+            count: Number of stimuli to generate
+
+        Returns:
+            Tuple of (cell indices, color indices) byte arrays of length count
+        """
+        positions = array.array('B', random.choices(range(self.grid_size * self.grid_size), k=count))
+        colors = array.array('B', random.choices(range(len(COLOR_NAMES)), k=count))
+        return positions, colors
 
-    def generate_color(self) -> str:
+    def find_matches(
+        self,
+        positions: array.array,
+        colors: array.array
+    ) -> Tuple[List[bool], List[bool]]:
         """
-        Randomly pick a color name for the color stream.
+        Work out every position and color match for a generated session.
+
+        Args:
+            positions: Cell indices for the whole session
+            colors: Color indices for the whole session
 
         Returns:
-            Color name as string
+            Tuple of (visual, color) match flags, one per stimulus; the
+            first n entries are always False
         """
-        return random.choice(list(ANSI_COLORS.keys()))
+        n = self.n
+        lead = [False] * n
+        visual_matches = lead + [a == b for a, b in zip(positions[n:], positions)]
+        color_matches = lead + [a == b for a, b in zip(colors[n:], colors)]
+        return visual_matches, color_matches
 
     def print_centered(self, text: str, width: Optional[int] = None) -> None:
         """
@@ -225,99 +862,176 @@ class NBackGame:
             width: Terminal width (auto-detected if None)
         """
         if width is None:
-            width = os.get_terminal_size().columns
+            width = self._term_size.columns
         print(text.center(width))
 
-    def print_header(self, title: str) -> None:
+    def write_screen(self, parts: List[str], clear: bool = False) -> None:
+        """
+        Write a fully built screen to the terminal in one go.
+
+        Args:
+            parts: Screen lines, each already terminated with a newline
+            clear: Clear the terminal first, as part of the same write
+        """
+        if clear:
+            self._grid_on_screen = False
+            if IS_WINDOWS:
+                os.system('cls')
+            else:
+                parts.insert(0, ANSI_CLEAR)
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+
+    def print_header(self, title: str, width: Optional[int] = None) -> None:
         """
         Print a styled header.
 
         Args:
             title: Header title
+            width: Terminal width (auto-detected if None)
         """
-        width = os.get_terminal_size().columns
-        print()
-        print(f"{THEME['HEADER']}{'═' * width}{THEME['RESET']}")
-        self.print_centered(f"{THEME['HEADER']}{SYMBOLS['BRAIN']} {title} {SYMBOLS['BRAIN']}{THEME['RESET']}")
-        print(f"{THEME['HEADER']}{'═' * width}{THEME['RESET']}")
-        print()
+        if width is None:
+            width = self._term_size.columns
+        self.write_screen(_header_lines(title, width))
 
     def display_grid(
         self,
-        position: Tuple[int, int],
-        color: str,
-        trial_num: Optional[int] = None
+        position: int,
+        color: int,
+        trial_num: Optional[int] = None,
+        message: Optional[str] = None
     ) -> None:
         """
         Display the current game state with the grid and position.
 
         Args:
-            position: Current position as (row, column)
-            color: Current color name
+            position: Current cell index, row * grid_size + column
+            color: Current color index into COLOR_NAMES
             trial_num: Current trial number (None for practice)
+            message: Optional line shown centered below the controls
         """
-        self.clear_screen()
-        terminal_width = os.get_terminal_size().columns
+        terminal_size = self._term_size
+        terminal_width = terminal_size.columns
+        parts: List[str] = []
 
         # Header
-        self.print_centered(f"{THEME['HEADER']}╔═══════════════════════════════════════╗{THEME['RESET']}")
-        self.print_centered(f"{THEME['HEADER']}║  DUAL N-BACK TRAINER  {SYMBOLS['BRAIN']}  Level: {self.n}  ║{THEME['RESET']}")
-        self.print_centered(f"{THEME['HEADER']}╚═══════════════════════════════════════╝{THEME['RESET']}")
-        print()
+        for line in self._grid_header:
+            parts.append(_centered(line, terminal_width))
+        parts.append("\n")
 
+        status_line = None
         if trial_num is not None:
             accuracy = (self.score / self.total_matches * 100) if self.total_matches > 0 else 0
             progress_bar = self._create_progress_bar(trial_num, self.trials, 30)
-            self.print_centered(
-                f"{THEME['INFO']}Trial: {trial_num}/{self.trials} {progress_bar} "
-                f"Score: {THEME['SUCCESS']}{self.score}{THEME['RESET']}"
-                f"{THEME['INFO']}/{self.total_matches} "
-                f"({accuracy:.1f}%){THEME['RESET']}"
+            status = _STATUS_TMPL % (
+                trial_num, self.trials, progress_bar, self.score, self.total_matches, accuracy
             )
-            print()
+            status_line = _centered(status, terminal_width)
+            parts.append(status_line)
+            parts.append("\n")
 
         # Grid
-        CELL_W = 7
-        CELL_H = 3
-        top_border = "╔" + ("═" * CELL_W + "╦") * (self.grid_size - 1) + "═" * CELL_W + "╗"
-        mid_border = "╠" + ("═" * CELL_W + "╬") * (self.grid_size - 1) + "═" * CELL_W + "╣"
-        bottom_border = "╚" + ("═" * CELL_W + "╩") * (self.grid_size - 1) + "═" * CELL_W + "╝"
-
-        grid_width = len(top_border)
-        padding = max(0, (terminal_width - grid_width) // 2)
-
-        print(" " * padding + top_border)
-
-        for row in range(self.grid_size):
-            for subrow in range(CELL_H):
-                row_str = " " * padding + "║"
-                for col in range(self.grid_size):
-                    if (row, col) == position and subrow == 1:
-                        dot = f"{ANSI_COLORS[color]}{SYMBOLS['DOT']}{ANSI_RESET}"
-                        left_pad = (CELL_W - 1) // 2
-                        right_pad = CELL_W - 1 - left_pad
-                        cell_content = " " * left_pad + dot + " " * right_pad
-                    else:
-                        cell_content = " " * CELL_W
-                    row_str += cell_content + "║"
-                print(row_str)
-            if row < self.grid_size - 1:
-                print(" " * padding + mid_border)
+        padding = max(0, (terminal_width - self._grid_width) // 2)
+        pad = " " * padding
+
+        size = self.grid_size
+        top_line, mid_line, empty_row, bottom_line, dot_rows = self._grid_lines(pad)
+        dot_row, dot_col = divmod(position, size)
+
+        parts.append(top_line)
+
+        for row in range(size):
+            if row != dot_row:
+                parts.extend([empty_row] * CELL_H)
+            else:
+                # Only the middle subrow of the dot's row differs from blank
+                dot_line = dot_rows[dot_col].replace(_DOT_SLOT, _DOT_CELL[color], 1)
+                for subrow in range(CELL_H):
+                    parts.append(dot_line if subrow == 1 else empty_row)
+            if row < size - 1:
+                parts.append(mid_line)
 
-        print(" " * padding + bottom_border)
+        parts.append(bottom_line)
 
         # Controls
-        print()
-        self.print_centered(f"{THEME['ACCENT']}┌───────────────────────────────────────────────┐{THEME['RESET']}")
-        self.print_centered(
-            f"{THEME['ACCENT']}│{THEME['RESET']}  "
-            f"{THEME['INFO']}L{THEME['RESET']} Location   "
-            f"{THEME['INFO']}A{THEME['RESET']} Color   "
-            f"{THEME['INFO']}SPACE{THEME['RESET']} Both  "
-            f"{THEME['DIM']}[H]elp [Q]uit [S]cores{THEME['RESET']}"
-            f"  {THEME['ACCENT']}│{THEME['RESET']}"
+        parts.append("\n")
+        for line in _CONTROLS_BOX:
+            parts.append(_centered(line, terminal_width))
+        message_line = None
+        if message is not None:
+            message_line = _centered(message, terminal_width)
+            parts.append(message_line)
+
+        self._last_frame = "".join(parts)
+
+        # Frames with the same layout differ only in the status line, the
+        # dot cell and the message, so repaint just those when possible
+        layout = (terminal_width, size, status_line is not None, message_line is not None)
+        # Cursor addressing only holds if nothing wraps or scrolls, including
+        # the two feedback lines run_game prints under the frame
+        fits = (
+            len(parts) + 2 < terminal_size.lines
+            and max(self._grid_width, _REFRESH_MIN_WIDTH) <= terminal_width
         )
-        self.print_centered(f"{THEME['ACCENT']}└───────────────────────────────────────────────┘{THEME['RESET']}")
+        previous = self._grid_state
+        self._grid_state = (layout, position, fits)
+        if fits and self._grid_on_screen and previous is not None and previous[0] == layout:
+            self._refresh(padding, previous[1], position, color, status_line, message_line)
+        else:
+            self._full_redraw()
+
+    def _full_redraw(self) -> None:
+        """Clear the terminal and repaint the most recent grid frame in full."""
+        self.write_screen([self._last_frame], clear=True)
+        # Only a frame that fits can later be updated in place
+        self._grid_on_screen = self._grid_state is not None and self._grid_state[2]
+
+    def _refresh(
+        self,
+        padding: int,
+        old_position: int,
+        position: int,
+        color: int,
+        status_line: Optional[str],
+        message_line: Optional[str]
+    ) -> None:
+        """
+        Update the frame on screen in place to match the new one.
+
+        Args:
+            padding: Left padding of the grid
+            old_position: Cell index of the dot currently on screen
+            position: New dot cell index
+            color: New dot color index
+            status_line: New status line, if the frame has one
+            message_line: New message line, if the frame has one
+        """
+        # Screen rows are 1-based; the grid header takes three lines plus a blank
+        top_row = 5 + (2 if status_line is not None else 0)
+
+        def dot_at(pos: int) -> str:
+            row, col = divmod(pos, self.grid_size)
+            screen_row = top_row + 1 + row * (CELL_H + 1) + CELL_H // 2
+            screen_col = padding + 2 + col * (CELL_W + 1) + _DOT_OFFSET
+            return f"\033[{screen_row};{screen_col}H"
+
+        # The rest of both cells is blank either way, so only the dot's
+        # column is rewritten
+        parts = [ANSI_HIDE_CURSOR]
+        if status_line is not None:
+            # Erase first: a shorter line that fills the width gets no
+            # padding from center() and would leave the old tail behind
+            parts.append(f"\033[5;1H\033[2K{status_line}")
+        parts.append(dot_at(old_position) + " ")
+        parts.append(dot_at(position) + _DOT_GLYPH[color])
+
+        # Drop any feedback printed under the controls, then restore the message
+        below_controls = top_row + self.grid_size * (CELL_H + 1) + 5
+        parts.append(f"\033[{below_controls};1H\033[J")
+        if message_line is not None:
+            parts.append(message_line)
+        parts.append(ANSI_SHOW_CURSOR)
+        self.write_screen(parts)
 
     def _create_progress_bar(self, current: int, total: int, width: int = 20) -> str:
         """
@@ -332,32 +1046,31 @@ class NBackGame:
             Formatted progress bar string
         """
         filled = int((current / total) * width)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+        return _progress_bars(width)[filled]
 
     def show_high_scores(self) -> None:
         """Display high scores in a formatted table."""
-        self.clear_screen()
-        terminal_width = os.get_terminal_size().columns
+        terminal_width = self._term_size.columns
 
-        self.print_header(f"{SYMBOLS['TROPHY']} HIGH SCORES {SYMBOLS['TROPHY']}")
+        parts = _header_lines(f"{SYMBOLS['TROPHY']} HIGH SCORES {SYMBOLS['TROPHY']}", terminal_width)
 
         if not self.high_scores:
-            self.print_centered(f"{THEME['DIM']}No high scores yet!{THEME['RESET']}")
-            self.print_centered(f"{THEME['DIM']}Play some games to set records.{THEME['RESET']}")
+            parts.append(_centered(f"{_D}No high scores yet!{_R}", terminal_width))
+            parts.append(_centered(f"{_D}Play some games to set records.{_R}", terminal_width))
         else:
             # Table header
-            self.print_centered(f"{THEME['BOLD']}{'#':<4} {'Level':<12} {'Accuracy':<12} {'Score':<15} {'Date':<12}{THEME['RESET']}")
-            self.print_centered(f"{THEME['DIM']}{'─' * 60}{THEME['RESET']}")
-
-            # Sorted scores
-            sorted_scores = sorted(
-                self.high_scores.items(),
-                key=lambda x: x[1]['accuracy'],
-                reverse=True
-            )[:10]
-
-            for i, (key, score) in enumerate(sorted_scores, 1):
+            parts.append(_centered(f"{_B}{'#':<4} {'Level':<12} {'Accuracy':<12} {'Score':<15} {'Date':<12}{_R}", terminal_width))
+            parts.append(_centered(f"{_D}{'─' * 60}{_R}", terminal_width))
+
+            # Best scores, ranked again only after a new record
+            if self._top_scores is None or self._top_scores[0] != self._scores_version:
+                self._top_scores = (self._scores_version, heapq.nlargest(
+                    10,
+                    self.high_scores.items(),
+                    key=lambda x: x[1]['accuracy']
+                ))
+
+            for i, (key, score) in enumerate(self._top_scores[1], 1):
                 config = key.replace("DN", "N-").replace("_G", " Grid:")
                 accuracy = f"{score['accuracy']:.1f}%"
                 score_text = f"{score['score']}/{score['total']}"
@@ -365,51 +1078,24 @@ class NBackGame:
 
                 # Color code by rank
                 if i == 1:
-                    color = THEME['SUCCESS']
+                    color = _S
                 elif i <= 3:
-                    color = THEME['INFO']
+                    color = _I
                 else:
-                    color = THEME['RESET']
+                    color = _R
 
-                record = f"{color}{i:<4} {config:<12} {accuracy:<12} {score_text:<15} {date:<12}{THEME['RESET']}"
-                self.print_centered(record)
+                record = f"{color}{i:<4} {config:<12} {accuracy:<12} {score_text:<15} {date:<12}{_R}"
+                parts.append(_centered(record, terminal_width))
 
-        print()
-        self.print_centered(f"{THEME['DIM']}Press any key to continue...{THEME['RESET']}")
+        parts.append("\n")
+        parts.append(_centered_line(_PROMPT_CONTINUE, terminal_width))
+        self.write_screen(parts, clear=True)
         self.wait_for_key()
 
     def show_help(self) -> None:
         """Display help information."""
-        self.clear_screen()
-
-        self.print_header("HELP GUIDE")
-
-        self.print_centered(f"{THEME['BOLD']}What is Dual N-Back?{THEME['RESET']}")
-        print()
-        self.print_centered("A cognitive training task that improves working memory")
-        self.print_centered("by tracking both position and color sequences.")
-        print()
-        print()
-
-        self.print_centered(f"{THEME['BOLD']}How to Play:{THEME['RESET']}")
-        print()
-        self.print_centered(f"{THEME['SUCCESS']}{SYMBOLS['ARROW']}{THEME['RESET']} Watch the colored dot appear on the grid")
-        self.print_centered(f"{THEME['SUCCESS']}{SYMBOLS['ARROW']}{THEME['RESET']} Remember positions and colors from N steps back")
-        self.print_centered(f"{THEME['SUCCESS']}{SYMBOLS['ARROW']}{THEME['RESET']} Press keys when you detect a match")
-        print()
-        print()
-
-        self.print_centered(f"{THEME['BOLD']}Controls:{THEME['RESET']}")
-        print()
-        self.print_centered(f"{THEME['INFO']}L{THEME['RESET']}          Match in location/position")
-        self.print_centered(f"{THEME['INFO']}A{THEME['RESET']}          Match in color")
-        self.print_centered(f"{THEME['INFO']}SPACE{THEME['RESET']}      Both location AND color match")
-        self.print_centered(f"{THEME['INFO']}H{THEME['RESET']}          Show this help")
-        self.print_centered(f"{THEME['INFO']}Q{THEME['RESET']}          Quit to menu")
-        self.print_centered(f"{THEME['INFO']}S{THEME['RESET']}          View high scores")
-        print()
-
-        self.print_centered(f"{THEME['DIM']}Press any key to continue...{THEME['RESET']}")
+        terminal_width = self._term_size.columns
+        self.write_screen([_render_help(terminal_width)], clear=True)
         self.wait_for_key()
 
     def show_menu(self) -> bool:
@@ -420,32 +1106,8 @@ class NBackGame:
             True if user wants to play, False to exit
         """
         while True:
-            self.clear_screen()
-            terminal_width = os.get_terminal_size().columns
-
-            print("\n" * 2)
-
-            # Title
-            self.print_centered(f"{THEME['HEADER']}╔═══════════════════════════════════════════════╗{THEME['RESET']}")
-            self.print_centered(f"{THEME['HEADER']}║                                               ║{THEME['RESET']}")
-            self.print_centered(f"{THEME['HEADER']}║        {SYMBOLS['BRAIN']} DUAL N-BACK TRAINER {SYMBOLS['BRAIN']}        ║{THEME['RESET']}")
-            self.print_centered(f"{THEME['HEADER']}║      Cognitive Enhancement Training          ║{THEME['RESET']}")
-            self.print_centered(f"{THEME['HEADER']}║                                               ║{THEME['RESET']}")
-            self.print_centered(f"{THEME['HEADER']}╚═══════════════════════════════════════════════╝{THEME['RESET']}")
-
-            print("\n" * 2)
-
-            # Menu options
-            self.print_centered(f"{THEME['SUCCESS']}1{THEME['RESET']} {SYMBOLS['ARROW']} Start New Game")
-            print()
-            self.print_centered(f"{THEME['INFO']}2{THEME['RESET']} {SYMBOLS['ARROW']} View High Scores")
-            print()
-            self.print_centered(f"{THEME['WARNING']}3{THEME['RESET']} {SYMBOLS['ARROW']} Help & Instructions")
-            print()
-            self.print_centered(f"{THEME['ERROR']}4{THEME['RESET']} {SYMBOLS['ARROW']} Exit")
-
-            print("\n" * 2)
-            self.print_centered(f"{THEME['DIM']}Select an option (1-4):{THEME['RESET']}")
+            terminal_width = self._term_size.columns
+            self.write_screen([_render_menu(terminal_width)], clear=True)
 
             choice = self.wait_for_key()
             if choice == '1':
@@ -456,39 +1118,18 @@ class NBackGame:
             elif choice == '3':
                 self.show_help()
             elif choice == '4':
-                self.clear_screen()
-                self.print_centered(f"{THEME['SUCCESS']}Thanks for training! Keep improving! {SYMBOLS['BRAIN']}{THEME['RESET']}")
-                print()
+                self.write_screen([
+                    _centered(f"{_S}Thanks for training! Keep improving! {SYMBOLS['BRAIN']}{_R}", terminal_width),
+                    "\n",
+                ], clear=True)
                 return False
 
     def show_game_settings(self) -> None:
         """Display game settings menu with interactive configuration."""
-        terminal_width = os.get_terminal_size().columns
+        terminal_width = self._term_size.columns
 
         # N value selection
-        self.clear_screen()
-        self.print_header("GAME CONFIGURATION")
-        self.print_centered(f"{THEME['ACCENT']}Step 1 of 4: Select N-Back Level{THEME['RESET']}")
-        print()
-
-        levels = [
-            ("1", "N=1", "Beginner"),
-            ("2", "N=2", "Easy"),
-            ("3", "N=3", "Normal"),
-            ("4", "N=4", "Challenging"),
-            ("5", "N=5", "Hard"),
-            ("6", "N=6", "Very Hard"),
-            ("7", "N=7", "Expert"),
-            ("8", "N=8", "Master"),
-        ]
-
-        for num, level, difficulty in levels:
-            if int(num) == 2:
-                marker = f"{THEME['SUCCESS']} (Recommended){THEME['RESET']}"
-            else:
-                marker = ""
-            self.print_centered(f"{THEME['INFO']}{num}{THEME['RESET']} {SYMBOLS['ARROW']} {level:<8} {THEME['DIM']}{difficulty}{THEME['RESET']}{marker}")
-
+        self.write_screen([_render_settings_step(1, terminal_width)], clear=True)
         while True:
             char = self.wait_for_key()
             if char in '12345678':
@@ -496,18 +1137,7 @@ class NBackGame:
                 break
 
         # Grid size selection
-        self.clear_screen()
-        self.print_header("GAME CONFIGURATION")
-        self.print_centered(f"{THEME['ACCENT']}Step 2 of 4: Select Grid Size{THEME['RESET']}")
-        print()
-
-        for size in range(3, 10):
-            if size == 8:
-                marker = f"{THEME['SUCCESS']} (Recommended){THEME['RESET']}"
-            else:
-                marker = ""
-            self.print_centered(f"{THEME['INFO']}{size}{THEME['RESET']} {SYMBOLS['ARROW']} {size}×{size} Grid{marker}")
-
+        self.write_screen([_render_settings_step(2, terminal_width)], clear=True)
         while True:
             char = self.wait_for_key()
             if char in '3456789':
@@ -515,203 +1145,170 @@ class NBackGame:
                 break
 
         # Trial count selection
-        self.clear_screen()
-        self.print_header("GAME CONFIGURATION")
-        self.print_centered(f"{THEME['ACCENT']}Step 3 of 4: Select Trial Count{THEME['RESET']}")
-        print()
-
-        trial_options = [20, 30, 40, 50, 60, 80]
-        for i, trials in enumerate(trial_options, 1):
-            if trials == 20:
-                marker = f"{THEME['SUCCESS']} (Recommended){THEME['RESET']}"
-            else:
-                marker = ""
-            self.print_centered(f"{THEME['INFO']}{i}{THEME['RESET']} {SYMBOLS['ARROW']} {trials} Trials{marker}")
-
+        self.write_screen([_render_settings_step(3, terminal_width)], clear=True)
         while True:
             char = self.wait_for_key()
             if char in '123456':
-                self.trials = trial_options[int(char) - 1]
+                self.trials = TRIAL_OPTIONS[int(char) - 1]
                 break
 
         # Display time selection
-        self.clear_screen()
-        self.print_header("GAME CONFIGURATION")
-        self.print_centered(f"{THEME['ACCENT']}Step 4 of 4: Select Response Time{THEME['RESET']}")
-        print()
-
-        times = [1.0, 1.5, 2.0, 2.5, 3.0]
-        for i, t in enumerate(times, 1):
-            if t == 2.0:
-                marker = f"{THEME['SUCCESS']} (Recommended){THEME['RESET']}"
-            else:
-                marker = ""
-            self.print_centered(f"{THEME['INFO']}{i}{THEME['RESET']} {SYMBOLS['ARROW']} {t:.1f}s per trial{marker}")
-
+        self.write_screen([_render_settings_step(4, terminal_width)], clear=True)
         while True:
             char = self.wait_for_key()
             if char in '12345':
-                self.display_time = times[int(char) - 1]
+                self.display_time = TIME_OPTIONS[int(char) - 1]
                 break
 
+        self._build_grid_chrome()
+
     def run_game(self) -> None:
         """Run a single game session."""
-        self.clear_screen()
+        # Hold the terminal in cbreak mode from the ready screen to the results
+        with self._raw_terminal():
+            self._run_session()
+
+    def _run_session(self) -> None:
+        """Show the ready screen, play every trial and report the results."""
+        terminal_width = self._term_size.columns
 
         # Configuration summary
-        self.print_header("GAME READY")
-
-        self.print_centered(f"{THEME['INFO']}N-Back Level:{THEME['RESET']} {THEME['BOLD']}{self.n}{THEME['RESET']}")
-        self.print_centered(f"{THEME['INFO']}Grid Size:{THEME['RESET']} {THEME['BOLD']}{self.grid_size}×{self.grid_size}{THEME['RESET']}")
-        self.print_centered(f"{THEME['INFO']}Trials:{THEME['RESET']} {THEME['BOLD']}{self.trials}{THEME['RESET']}")
-        self.print_centered(f"{THEME['INFO']}Response Time:{THEME['RESET']} {THEME['BOLD']}{self.display_time:.1f}s{THEME['RESET']}")
-        print()
-        print()
-        self.print_centered(f"{THEME['WARNING']}First, memorize {self.n} position/color pairs{THEME['RESET']}")
-        self.print_centered(f"{THEME['DIM']}Then respond to matches during the game{THEME['RESET']}")
-
-        print("\n" * 2)
-        self.print_centered(f"{THEME['SUCCESS']}Press any key to begin training...{THEME['RESET']}")
+        parts = _header_lines("GAME READY", terminal_width)
+
+        parts.append(_centered(f"{_I}N-Back Level:{_R} {_B}{self.n}{_R}", terminal_width))
+        parts.append(_centered(f"{_I}Grid Size:{_R} {_B}{self.grid_size}×{self.grid_size}{_R}", terminal_width))
+        parts.append(_centered(f"{_I}Trials:{_R} {_B}{self.trials}{_R}", terminal_width))
+        parts.append(_centered(f"{_I}Response Time:{_R} {_B}{self.display_time:.1f}s{_R}", terminal_width))
+        parts.append("\n")
+        parts.append("\n")
+        parts.append(_centered(f"{_W}First, memorize {self.n} position/color pairs{_R}", terminal_width))
+        parts.append(_centered(f"{_D}Then respond to matches during the game{_R}", terminal_width))
+
+        parts.append("\n" * 3)
+        parts.append(_centered_line(_PROMPT_BEGIN, terminal_width))
+        self.write_screen(parts, clear=True)
         self.wait_for_key()
 
         # Reset game state
-        self.sequence = []
-        self.color_sequence = []
         self.score = 0
         self.total_matches = 0
         self.current_trial = 0
         self.is_running = True
+        positions, colors = self.generate_stimuli(self.n + self.trials)
+        self.sequence, self.color_sequence = positions, colors
+        visual_matches, color_matches = self.find_matches(positions, colors)
+
+        # One walk over the session; the first n stimuli are only memorized
+        display_ns = int(self.display_time * 1e9)
+        for i in range(self.n + self.trials):
+            if not self.is_running:
+                break
+            position = positions[i]
+            color = colors[i]
 
-        # Memory phase
-        for i in range(self.n):
-            position = self.generate_position()
-            color = self.generate_color()
-            self.sequence.append(position)
-            self.color_sequence.append(color)
-            self.display_grid(position, color)
-            self.print_centered(f"{THEME['WARNING']}Memorize item {i+1} of {self.n}{THEME['RESET']}")
-            time.sleep(self.display_time)
-
-        self.clear_screen()
-        self.print_centered(f"\n\n{THEME['SUCCESS']}Memory phase complete! {SYMBOLS['CHECK']}{THEME['RESET']}")
-        self.print_centered(f"{THEME['INFO']}Game starting...{THEME['RESET']}")
-        time.sleep(1.5)
-
-        # Main game loop
-        for trial in range(self.trials):
-            self.current_trial = trial + 1
-            position = self.generate_position()
-            color = self.generate_color()
-            self.sequence.append(position)
-            self.color_sequence.append(color)
-
+            if i < self.n:
+                self.display_grid(
+                    position, color,
+                    message=f"{_W}Memorize item {i+1} of {self.n}{_R}"
+                )
+                if not self._wait_or_quit(self.display_time) and i == self.n - 1:
+                    self.write_screen([
+                        _centered(f"\n\n{_S}Memory phase complete! {SYMBOLS['CHECK']}{_R}", self._term_size.columns),
+                        _centered(f"{_I}Game starting...{_R}", self._term_size.columns),
+                    ], clear=True)
+                    self._wait_or_quit(1.5)
+                continue
+
+            self.current_trial = i - self.n + 1
             self.display_grid(position, color, self.current_trial)
 
-            if len(self.sequence) > self.n:
-                is_visual_match = (position == self.sequence[-(self.n + 1)])
-                is_color_match = (color == self.color_sequence[-(self.n + 1)])
-
-                if is_visual_match:
-                    self.total_matches += 1
-                if is_color_match:
-                    self.total_matches += 1
-
-                # Wait for user input with timeout
-                start_time = time.time()
-                response = None
-                while time.time() - start_time < self.display_time:
-                    char = self.get_char()
-                    if char:
-                        if char == 'h':
-                            self.show_help()
-                            self.display_grid(position, color, self.current_trial)
-                            continue
-                        elif char == 's':
-                            self.show_high_scores()
-                            self.display_grid(position, color, self.current_trial)
-                            continue
-                        elif char == 'q':
-                            self.is_running = False
-                            break
-                        elif char in 'al ':
-                            if char == ' ':
-                                response = 'both'
-                            else:
-                                response = char
-                            break
-
-                if not self.is_running:
-                    break
+            is_visual_match = visual_matches[i]
+            is_color_match = color_matches[i]
 
-                # Feedback
-                print()
-                if response is None:
-                    self.print_centered(f"{THEME['DIM']}⏱ Time's up!{THEME['RESET']}")
-                else:
-                    correct = False
-                    points_earned = 0
-
-                    if response == 'l' and is_visual_match and not is_color_match:
-                        points_earned = 1
-                        correct = True
-                    elif response == 'a' and is_color_match and not is_visual_match:
-                        points_earned = 1
-                        correct = True
-                    elif response == 'both' and is_visual_match and is_color_match:
-                        points_earned = 2
-                        correct = True
-                    elif response == 'l' and not is_visual_match:
-                        correct = False
-                    elif response == 'a' and not is_color_match:
-                        correct = False
-                    elif response == 'both' and not (is_visual_match and is_color_match):
-                        correct = False
+            if is_visual_match:
+                self.total_matches += 1
+            if is_color_match:
+                self.total_matches += 1
+
+            # Block until a key arrives or the response window closes
+            deadline_ns = time.monotonic_ns() + display_ns
+            response = None
+            while True:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                char = self._next_key(remaining_ns / 1e9)
+                if not char:
+                    break
+                if char == 'h':
+                    self.show_help()
+                    self._full_redraw()
+                elif char == 's':
+                    self.show_high_scores()
+                    self._full_redraw()
+                elif char == 'q':
+                    self.is_running = False
+                    break
+                elif char in 'al ':
+                    if char == ' ':
+                        response = 'both'
                     else:
-                        correct = False
+                        response = char
+                    break
 
-                    self.score += points_earned
+            if not self.is_running:
+                break
 
-                    if correct:
-                        self.print_centered(
-                            f"{THEME['SUCCESS']}{SYMBOLS['CHECK']} Correct! "
-                            f"+{points_earned} point{'s' if points_earned > 1 else ''}{THEME['RESET']}"
-                        )
-                    else:
-                        self.print_centered(f"{THEME['ERROR']}{SYMBOLS['CROSS']} Incorrect!{THEME['RESET']}")
+            # Feedback
+            if response is None:
+                feedback = f"{_D}⏱ Time's up!{_R}"
+            else:
+                points_earned, correct = SCORE_TABLE[(response, is_visual_match, is_color_match)]
+                self.score += points_earned
+
+                if correct:
+                    feedback = (
+                        f"{_S}{SYMBOLS['CHECK']} Correct! "
+                        f"+{points_earned} point{'s' if points_earned > 1 else ''}{_R}"
+                    )
+                else:
+                    feedback = f"{_E}{SYMBOLS['CROSS']} Incorrect!{_R}"
+            self.write_screen(["\n", _centered(feedback, self._term_size.columns)])
 
-                time.sleep(0.6)
+            if not self.fast:
+                self._wait_or_quit(0.6)
 
         # Game over screen
         if self.is_running:
-            self.clear_screen()
+            terminal_width = self._term_size.columns
 
-            self.print_header(f"{SYMBOLS['TROPHY']} TRAINING COMPLETE {SYMBOLS['TROPHY']}")
+            parts = _header_lines(f"{SYMBOLS['TROPHY']} TRAINING COMPLETE {SYMBOLS['TROPHY']}", terminal_width)
 
             if self.total_matches > 0:
                 accuracy = (self.score / self.total_matches) * 100
 
                 # Performance rating
                 if accuracy >= 90:
-                    rating = f"{THEME['SUCCESS']}OUTSTANDING!{THEME['RESET']}"
-                    stars = f"{THEME['SUCCESS']}{SYMBOLS['STAR'] * 5}{THEME['RESET']}"
+                    rating = f"{_S}OUTSTANDING!{_R}"
+                    stars = f"{_S}{SYMBOLS['STAR'] * 5}{_R}"
                 elif accuracy >= 75:
-                    rating = f"{THEME['SUCCESS']}EXCELLENT!{THEME['RESET']}"
-                    stars = f"{THEME['SUCCESS']}{SYMBOLS['STAR'] * 4}{THEME['RESET']}"
+                    rating = f"{_S}EXCELLENT!{_R}"
+                    stars = f"{_S}{SYMBOLS['STAR'] * 4}{_R}"
                 elif accuracy >= 60:
-                    rating = f"{THEME['INFO']}GOOD JOB!{THEME['RESET']}"
-                    stars = f"{THEME['INFO']}{SYMBOLS['STAR'] * 3}{THEME['RESET']}"
+                    rating = f"{_I}GOOD JOB!{_R}"
+                    stars = f"{_I}{SYMBOLS['STAR'] * 3}{_R}"
                 elif accuracy >= 40:
-                    rating = f"{THEME['WARNING']}KEEP PRACTICING!{THEME['RESET']}"
-                    stars = f"{THEME['WARNING']}{SYMBOLS['STAR'] * 2}{THEME['RESET']}"
+                    rating = f"{_W}KEEP PRACTICING!{_R}"
+                    stars = f"{_W}{SYMBOLS['STAR'] * 2}{_R}"
                 else:
-                    rating = f"{THEME['ERROR']}TRY AGAIN!{THEME['RESET']}"
-                    stars = f"{THEME['ERROR']}{SYMBOLS['STAR']}{THEME['RESET']}"
+                    rating = f"{_E}TRY AGAIN!{_R}"
+                    stars = f"{_E}{SYMBOLS['STAR']}{_R}"
 
-                self.print_centered(rating)
-                self.print_centered(stars)
-                print()
-                self.print_centered(f"{THEME['BOLD']}Final Score:{THEME['RESET']} {THEME['SUCCESS']}{self.score}{THEME['RESET']}/{self.total_matches}")
-                self.print_centered(f"{THEME['BOLD']}Accuracy:{THEME['RESET']} {THEME['INFO']}{accuracy:.1f}%{THEME['RESET']}")
+                parts.append(_centered(rating, terminal_width))
+                parts.append(_centered(stars, terminal_width))
+                parts.append("\n")
+                parts.append(_centered(f"{_B}Final Score:{_R} {_S}{self.score}{_R}/{self.total_matches}", terminal_width))
+                parts.append(_centered(f"{_B}Accuracy:{_R} {_I}{accuracy:.1f}%{_R}", terminal_width))
 
                 # Check for high score
                 key = f"DN{self.n}_G{self.grid_size}"
@@ -721,25 +1318,27 @@ class NBackGame:
                 )
 
                 if is_new_record:
-                    print()
-                    self.print_centered(f"{THEME['SUCCESS']}{SYMBOLS['TROPHY']} NEW HIGH SCORE! {SYMBOLS['TROPHY']}{THEME['RESET']}")
-
-                self.save_high_score()
+                    parts.append("\n")
+                    parts.append(_centered(f"{_S}{SYMBOLS['TROPHY']} NEW HIGH SCORE! {SYMBOLS['TROPHY']}{_R}", terminal_width))
             else:
-                self.print_centered(f"{THEME['DIM']}No scoring opportunities in this session{THEME['RESET']}")
+                parts.append(_centered(f"{_D}No scoring opportunities in this session{_R}", terminal_width))
 
-            print("\n" * 2)
-            self.print_centered(f"{THEME['DIM']}Press any key to return to menu...{THEME['RESET']}")
+            parts.append("\n" * 3)
+            parts.append(_centered_line(_PROMPT_MENU, terminal_width))
+            self.write_screen(parts, clear=True)
+            self.save_high_score()
             self.wait_for_key()
 
     def play(self) -> None:
         """Main game loop."""
         try:
-            while True:
-                if self.show_menu():
-                    self.run_game()
-                else:
-                    break
+            # Keep cbreak mode across the menus and every game
+            with self._raw_terminal():
+                while True:
+                    if self.show_menu():
+                        self.run_game()
+                    else:
+                        break
         except KeyboardInterrupt:
             self.clear_screen()
             self.print_centered(f"\n{THEME['INFO']}Game interrupted. Goodbye!{THEME['RESET']}\n")
@@ -748,6 +1347,8 @@ class NBackGame:
             self.clear_screen()
             print(f"{THEME['ERROR']}An error occurred: {e}{THEME['RESET']}")
             sys.exit(1)
+        finally:
+            self.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -766,7 +1367,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         '-n', '--n-value',
         type=int,
-        choices=range(1, 9),
+        choices=_N_CHOICES,
         default=None,
         metavar='N',
         help='Set the N value (1-8, default: 2)'
@@ -774,7 +1375,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         '-g', '--grid-size',
         type=int,
-        choices=range(3, 10),
+        choices=_G_CHOICES,
         default=None,
         metavar='SIZE',
         help='Set the grid size (3-9, default: 8)'
@@ -782,7 +1383,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         '-t', '--trials',
         type=int,
-        choices=[20, 30, 40, 50, 60, 80],
+        choices=_T_CHOICES,
         default=None,
         metavar='N',
         help='Set number of trials (20, 30, 40, 50, 60, or 80)'
@@ -794,6 +1395,12 @@ def parse_args() -> argparse.Namespace:
         metavar='SECONDS',
         help='Set display time in seconds (default: 2.0)'
     )
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help="Skip the pause after each trial's feedback (pacing only; "
+             "does not skip the menu)"
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -808,7 +1415,8 @@ def main() -> None:
     try:
         args = parse_args()
 
-        # Check if any game parameters were provided via command line
+        # Check if any game parameters were provided via command line;
+        # --fast only changes pacing, so on its own it still shows the menu
         game_args_provided = any([
             args.n_value is not None,
             args.grid_size is not None,
@@ -820,12 +1428,16 @@ def main() -> None:
             n=args.n_value if args.n_value is not None else 2,
             grid_size=args.grid_size if args.grid_size is not None else 8,
             trials=args.trials if args.trials is not None else 20,
-            display_time=args.display_time
+            display_time=args.display_time,
+            fast=args.fast
         )
 
         if game_args_provided:
             # Skip menu and go directly to game
-            game.run_game()
+            try:
+                game.run_game()
+            finally:
+                game.close()
         else:
             # Show menu system
             game.play()